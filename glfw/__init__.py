@@ -46,12 +46,22 @@ Everything works as described in the GLFW reference manual, with a few changes:
    negative size into glfw.OpenWindow raises a ValueError, and passing a list
    into glfw.SetWindowTitle results in a TypeError being raised. This is done
    because GLFW 2.7.5 has no error messages, and thus this will ease debugging.
+   The functions typically called every frame (glfw.GetKey, glfw.GetMouseButton,
+   glfw.GetWindowParam and glfw.SetMousePos) skip these checks when Python runs
+   optimized (-O). The joystick functions only skip their type checks, the
+   joystick id is always range checked because GLFW doesn't check it.
  * glfw.Init does not return an integer indicating the status, instead it
    always returns None and raises an InitError if the initialization failed. The
    same goes for glfw.OpenWindow, except it raises OpeningWindowError.
  * The callback function typedefs have been removed. Instead, callback functions
    can be passed regular Python functions taking the appropriate number of
    arguments.
+ * The key, mouse button, joystick and window parameter constants are members
+   of the IntEnums glfw.Key, glfw.MouseButton, glfw.Joystick and
+   glfw.WindowParam. They are also available as module level constants. They
+   compare and compute like plain integers (glfw.KEY_ESC == 257), but on Python
+   versions before 3.11 str() and repr() give the member name, for example
+   'Key.KEY_ESC', so use int() to format them as numbers.
  * GLFW_KEY_SPACE is removed.
  * The functions/callbacks taking/returning either a latin-1 character or an
    integer in C take and return either a unicode or an int in the wrapper. Any
@@ -61,93 +71,135 @@ Everything works as described in the GLFW reference manual, with a few changes:
    situation to debug.
  * The callback set with glfw.SetCharCallback always gets called with a
    one-character unicode string and never with an integer value.
+ * Callbacks can also be compiled to machine code with numba by decorating them
+   with glfw.jit_callback(signature), for example
+   @glfw.jit_callback("void(int32, int32)") for a mouse position callback. GLFW
+   calls these without entering the Python interpreter, so they get the raw C
+   arguments (key and character codes stay integers) and a window close
+   callback must return an int. numba compiles cdecl functions, so this doesn't
+   work on 32-bit Windows, where GLFW expects stdcall callbacks.
+ * glfw.SetWindowTitle takes either a unicode string, which gets encoded as
+   latin-1, or an already encoded bytes object. The same goes for the names
+   passed to glfw.ExtensionSupported and glfw.GetProcAddress.
  * glfw.GetJoystickPos and glfw.GetJoystickButtons only take one parameter, the
-   joystick id, and return a list of available data about respectively the axes
-   positions and button states.
+   joystick id, and return an array.array of available data about respectively
+   the axes positions (floats) and button states (unsigned bytes). These support
+   the buffer protocol, so they can be handed to numpy.frombuffer and the like
+   without copying.
    
 Other than the above changes everything works exactly as in the GLFW reference
 manual.
+
+Every call into GLFW crosses the ctypes boundary, so keep the number of calls
+per frame down. glfw.SwapBuffers already polls for events unless
+glfw.AUTO_POLL_EVENTS has been disabled, so a render loop doesn't need to call
+glfw.PollEvents as well. Applications that only redraw in response to input
+should block in glfw.WaitEvents rather than spin on glfw.PollEvents.
 """
 
+import enum as _enum
+import functools as _functools
 import inspect as _inspect
+import numbers as _numbers
+import sys as _sys
+import types as _types
 import ctypes as _ctypes
 from ctypes.util import find_library as _find_library
+from array import array as _array
+import struct as _struct
+
 
-# Python cross-version support
-# We support a minimum of version 2.5 - it's final release was in August 2006,
-# at the time of this writing that's over 5 years ago. Any older versions are
-# not of any interest (not to mention that ctypes was not built-in until 2.5.)
+def _is_int(obj):
+    """Returns True if obj has numbers.Integral as ABC, else False."""
+    
+    # the ABC check is slow, so plain ints take a shortcut
+    return type(obj) is int or isinstance(obj, _numbers.Integral)
+    
+    
+def _is_real(obj):
+    """Returns True if obj has numbers.Real as ABC, else False."""
+    
+    return type(obj) is int or type(obj) is float or isinstance(obj, _numbers.Real)
+    
+    
+@_functools.lru_cache(maxsize=64)
+def _encode_latin1(string):
+    """Returns string encoded as latin-1.
+    
+    Strings passed to GLFW tend to repeat (think window titles showing a frame
+    counter), so the encoded results are cached.
+    """
+    
+    return string.encode("latin-1")
 
-import sys
 
-if sys.version_info.major == 3:
-    _unichr = chr
-else:
-    _unichr = unichr
+# the one-character strings for all latin-1 codes, the key and char callbacks
+# index this instead of calling chr() on every event
+_CHR256 = tuple(chr(i) for i in range(256))
 
+# the keycodes of all one-character latin-1 strings, GLFW uses the uppercase
+# ASCII codes for letter keys
+_KEY_FROM_STR = dict((char, char.encode("latin-1").upper()[0]) for char in _CHR256)
     
-if sys.version_info.major == 2 and sys.version_info.minor < 6:
-    def _is_int(obj):
-        """Returns True if obj is an int, else False."""
-        
-        return isinstance(obj, int)
     
+def _is_native_callback(obj):
+    """Returns True if obj is a numba compiled callback (see jit_callback), False otherwise."""
     
-    def _is_real(obj):
-        """Returns True if obj is an int or float, else False."""
-        
-        return isinstance(obj, int) or isinstance(obj, float)
+    # numba can't have compiled obj unless it has been imported already
+    ccallback = _sys.modules.get("numba.core.ccallback")
     
+    return ccallback is not None and isinstance(obj, ccallback.CFunc)
+
+
+def _native_callback(callbacktype, func):
+    """Returns a function pointer of type callbacktype to the compiled callback func."""
     
-    def _is_callable_nargs(obj, nargs):
-        """Returns True if obj is a callable taking nargs positional arguments, False otherwise.
-        
-        For builtins only the check for callable is made, since builtins can't be inspected for
-        the amount of arguments they take.
-        """
-        
-        try:
-            _inspect.getcallargs(obj, *[None for _ in range(nargs)])
-        except TypeError:
-            # we can't inspect builtins, thus we can't reject them now
-            # however we can do a simple "is callable" check
-            if not (_inspect.isbuiltin(obj) and callable(obj)):
-                return False
-                
-        return True
-        
-else:
-    import numbers as _numbers
-    import collections as _collections
+    callback = callbacktype(func.address)
     
-    def _is_int(obj):
-        """Returns True if obj has numbers.Integral as ABC, else False."""
-        
-        return isinstance(obj, _numbers.Integral)
-        
-        
-    def _is_real(obj):
-        """Returns True if obj has numbers.Real as ABC, else False."""
-        
-        return isinstance(obj, _numbers.Real)
-        
-        
-    def _is_callable_nargs(obj, nargs):
-        """Returns True if obj is a callable taking nargs positional arguments, False otherwise.
+    # the function pointer alone doesn't keep the compiled code alive
+    callback._native = func
+    
+    return callback
+
+
+def _is_callable_nargs(obj, nargs):
+    """Returns True if obj is a callable taking nargs positional arguments, False otherwise.
+    
+    For callables without an inspectable signature (some builtins) only the check for
+    callable is made.
+    """
+    
+    func = obj
+    if isinstance(func, _types.MethodType) and isinstance(func.__func__, _types.FunctionType):
+        # bound plain function, the instance gets passed as the first argument
+        func = func.__func__
+        nargs += 1
+    
+    if isinstance(func, _types.FunctionType):
+        # plain Python function - read the argument counts straight off the
+        # code object instead of having inspect build a signature
+        code = func.__code__
         
-        For builtins only the check for callable is made, since builtins can't be inspected for
-        the amount of arguments they take.
-        """
+        if nargs < code.co_argcount - len(func.__defaults__ or ()):
+            return False
         
-        try:
-            _inspect.getcallargs(obj, *[None for _ in range(nargs)])
-        except TypeError:
-            if not (_inspect.isbuiltin(obj) and isinstance(obj, _collections.Callable)):
-                return False
-                
-        return True
+        if nargs > code.co_argcount and not code.co_flags & _inspect.CO_VARARGS:
+            return False
         
-del sys
+        # keyword-only arguments without a default can't be satisfied either
+        return len(func.__kwdefaults__ or ()) >= code.co_kwonlyargcount
+    
+    try:
+        signature = _inspect.signature(obj)
+    except (TypeError, ValueError):
+        return callable(obj)
+    
+    try:
+        signature.bind(*[None] * nargs)
+    except TypeError:
+        return False
+            
+    return True
 
 
 ##################
@@ -162,152 +214,320 @@ VERSION_REVISION = 5
 GLFW_RELEASE = 0
 GLFW_PRESS = 1
 
+# The constants below are grouped in IntEnums, and each member is also
+# available as a module level constant (glfw.KEY_ESC is glfw.Key.KEY_ESC.)
+# They compare and compute like plain integers, but validating functions can
+# skip their checks for members of the right enum.
+
 # keyboard key definitions: 8-bit ISO-8859-1 (Latin 1) encoding is used
 # for printable keys (such as A-Z, 0-9 etc), and values above 256
 # represent special (non-printable) keys (e.g. F1, Page Up etc)
-KEY_UNKNOWN = -1
-# KEY_SPACE = 32 # this has been ommited to make all keycodes outside of latin 1
-                 # range so we can safely translate all keys < 256 with chr()
-                 # without having to worry about users checking for KEY_SPACE
-KEY_SPECIAL = 256
-KEY_ESC = KEY_SPECIAL + 1
-KEY_F1 = KEY_SPECIAL + 2
-KEY_F2 = KEY_SPECIAL + 3
-KEY_F3 = KEY_SPECIAL + 4
-KEY_F4 = KEY_SPECIAL + 5
-KEY_F5 = KEY_SPECIAL + 6
-KEY_F6 = KEY_SPECIAL + 7
-KEY_F7 = KEY_SPECIAL + 8
-KEY_F8 = KEY_SPECIAL + 9
-KEY_F9 = KEY_SPECIAL + 10
-KEY_F10 = KEY_SPECIAL + 11
-KEY_F11 = KEY_SPECIAL + 12
-KEY_F12 = KEY_SPECIAL + 13
-KEY_F13 = KEY_SPECIAL + 14
-KEY_F14 = KEY_SPECIAL + 15
-KEY_F15 = KEY_SPECIAL + 16
-KEY_F16 = KEY_SPECIAL + 17
-KEY_F17 = KEY_SPECIAL + 18
-KEY_F18 = KEY_SPECIAL + 19
-KEY_F19 = KEY_SPECIAL + 20
-KEY_F20 = KEY_SPECIAL + 21
-KEY_F21 = KEY_SPECIAL + 22
-KEY_F22 = KEY_SPECIAL + 23
-KEY_F23 = KEY_SPECIAL + 24
-KEY_F24 = KEY_SPECIAL + 25
-KEY_F25 = KEY_SPECIAL + 26
-KEY_UP = KEY_SPECIAL + 27
-KEY_DOWN = KEY_SPECIAL + 28
-KEY_LEFT = KEY_SPECIAL + 29
-KEY_RIGHT = KEY_SPECIAL + 30
-KEY_LSHIFT = KEY_SPECIAL + 31
-KEY_RSHIFT = KEY_SPECIAL + 32
-KEY_LCTRL = KEY_SPECIAL + 33
-KEY_RCTRL = KEY_SPECIAL + 34
-KEY_LALT = KEY_SPECIAL + 35
-KEY_RALT = KEY_SPECIAL + 36
-KEY_TAB = KEY_SPECIAL + 37
-KEY_ENTER = KEY_SPECIAL + 38
-KEY_BACKSPACE = KEY_SPECIAL + 39
-KEY_INSERT = KEY_SPECIAL + 40
-KEY_DEL = KEY_SPECIAL + 41
-KEY_PAGEUP = KEY_SPECIAL + 42
-KEY_PAGEDOWN = KEY_SPECIAL + 43
-KEY_HOME = KEY_SPECIAL + 44
-KEY_END = KEY_SPECIAL + 45
-KEY_KP_0 = KEY_SPECIAL + 46
-KEY_KP_1 = KEY_SPECIAL + 47
-KEY_KP_2 = KEY_SPECIAL + 48
-KEY_KP_3 = KEY_SPECIAL + 49
-KEY_KP_4 = KEY_SPECIAL + 50
-KEY_KP_5 = KEY_SPECIAL + 51
-KEY_KP_6 = KEY_SPECIAL + 52
-KEY_KP_7 = KEY_SPECIAL + 53
-KEY_KP_8 = KEY_SPECIAL + 54
-KEY_KP_9 = KEY_SPECIAL + 55
-KEY_KP_DIVIDE = KEY_SPECIAL + 56
-KEY_KP_MULTIPLY = KEY_SPECIAL + 57
-KEY_KP_SUBTRACT = KEY_SPECIAL + 58
-KEY_KP_ADD = KEY_SPECIAL + 59
-KEY_KP_DECIMAL = KEY_SPECIAL + 60
-KEY_KP_EQUAL = KEY_SPECIAL + 61
-KEY_KP_ENTER = KEY_SPECIAL + 62
-KEY_KP_NUM_LOCK = KEY_SPECIAL + 63
-KEY_CAPS_LOCK = KEY_SPECIAL + 64
-KEY_SCROLL_LOCK = KEY_SPECIAL + 65
-KEY_PAUSE = KEY_SPECIAL + 66
-KEY_LSUPER = KEY_SPECIAL + 67
-KEY_RSUPER = KEY_SPECIAL + 68
-KEY_MENU = KEY_SPECIAL + 69
-KEY_LAST = KEY_MENU
+class Key(_enum.IntEnum):
+    """Keyboard keys, for use with glfw.GetKey and the key callback."""
+    
+    KEY_UNKNOWN = -1
+    # KEY_SPACE = 32 # this has been ommited to make all keycodes outside of latin 1
+                     # range so we can safely translate all keys < 256 with chr()
+                     # without having to worry about users checking for KEY_SPACE
+    KEY_SPECIAL = 256
+    KEY_ESC = KEY_SPECIAL + 1
+    KEY_F1 = KEY_SPECIAL + 2
+    KEY_F2 = KEY_SPECIAL + 3
+    KEY_F3 = KEY_SPECIAL + 4
+    KEY_F4 = KEY_SPECIAL + 5
+    KEY_F5 = KEY_SPECIAL + 6
+    KEY_F6 = KEY_SPECIAL + 7
+    KEY_F7 = KEY_SPECIAL + 8
+    KEY_F8 = KEY_SPECIAL + 9
+    KEY_F9 = KEY_SPECIAL + 10
+    KEY_F10 = KEY_SPECIAL + 11
+    KEY_F11 = KEY_SPECIAL + 12
+    KEY_F12 = KEY_SPECIAL + 13
+    KEY_F13 = KEY_SPECIAL + 14
+    KEY_F14 = KEY_SPECIAL + 15
+    KEY_F15 = KEY_SPECIAL + 16
+    KEY_F16 = KEY_SPECIAL + 17
+    KEY_F17 = KEY_SPECIAL + 18
+    KEY_F18 = KEY_SPECIAL + 19
+    KEY_F19 = KEY_SPECIAL + 20
+    KEY_F20 = KEY_SPECIAL + 21
+    KEY_F21 = KEY_SPECIAL + 22
+    KEY_F22 = KEY_SPECIAL + 23
+    KEY_F23 = KEY_SPECIAL + 24
+    KEY_F24 = KEY_SPECIAL + 25
+    KEY_F25 = KEY_SPECIAL + 26
+    KEY_UP = KEY_SPECIAL + 27
+    KEY_DOWN = KEY_SPECIAL + 28
+    KEY_LEFT = KEY_SPECIAL + 29
+    KEY_RIGHT = KEY_SPECIAL + 30
+    KEY_LSHIFT = KEY_SPECIAL + 31
+    KEY_RSHIFT = KEY_SPECIAL + 32
+    KEY_LCTRL = KEY_SPECIAL + 33
+    KEY_RCTRL = KEY_SPECIAL + 34
+    KEY_LALT = KEY_SPECIAL + 35
+    KEY_RALT = KEY_SPECIAL + 36
+    KEY_TAB = KEY_SPECIAL + 37
+    KEY_ENTER = KEY_SPECIAL + 38
+    KEY_BACKSPACE = KEY_SPECIAL + 39
+    KEY_INSERT = KEY_SPECIAL + 40
+    KEY_DEL = KEY_SPECIAL + 41
+    KEY_PAGEUP = KEY_SPECIAL + 42
+    KEY_PAGEDOWN = KEY_SPECIAL + 43
+    KEY_HOME = KEY_SPECIAL + 44
+    KEY_END = KEY_SPECIAL + 45
+    KEY_KP_0 = KEY_SPECIAL + 46
+    KEY_KP_1 = KEY_SPECIAL + 47
+    KEY_KP_2 = KEY_SPECIAL + 48
+    KEY_KP_3 = KEY_SPECIAL + 49
+    KEY_KP_4 = KEY_SPECIAL + 50
+    KEY_KP_5 = KEY_SPECIAL + 51
+    KEY_KP_6 = KEY_SPECIAL + 52
+    KEY_KP_7 = KEY_SPECIAL + 53
+    KEY_KP_8 = KEY_SPECIAL + 54
+    KEY_KP_9 = KEY_SPECIAL + 55
+    KEY_KP_DIVIDE = KEY_SPECIAL + 56
+    KEY_KP_MULTIPLY = KEY_SPECIAL + 57
+    KEY_KP_SUBTRACT = KEY_SPECIAL + 58
+    KEY_KP_ADD = KEY_SPECIAL + 59
+    KEY_KP_DECIMAL = KEY_SPECIAL + 60
+    KEY_KP_EQUAL = KEY_SPECIAL + 61
+    KEY_KP_ENTER = KEY_SPECIAL + 62
+    KEY_KP_NUM_LOCK = KEY_SPECIAL + 63
+    KEY_CAPS_LOCK = KEY_SPECIAL + 64
+    KEY_SCROLL_LOCK = KEY_SPECIAL + 65
+    KEY_PAUSE = KEY_SPECIAL + 66
+    KEY_LSUPER = KEY_SPECIAL + 67
+    KEY_RSUPER = KEY_SPECIAL + 68
+    KEY_MENU = KEY_SPECIAL + 69
+    KEY_LAST = KEY_MENU
+
+# module level aliases
+KEY_UNKNOWN = Key.KEY_UNKNOWN
+KEY_SPECIAL = Key.KEY_SPECIAL
+KEY_ESC = Key.KEY_ESC
+KEY_F1 = Key.KEY_F1
+KEY_F2 = Key.KEY_F2
+KEY_F3 = Key.KEY_F3
+KEY_F4 = Key.KEY_F4
+KEY_F5 = Key.KEY_F5
+KEY_F6 = Key.KEY_F6
+KEY_F7 = Key.KEY_F7
+KEY_F8 = Key.KEY_F8
+KEY_F9 = Key.KEY_F9
+KEY_F10 = Key.KEY_F10
+KEY_F11 = Key.KEY_F11
+KEY_F12 = Key.KEY_F12
+KEY_F13 = Key.KEY_F13
+KEY_F14 = Key.KEY_F14
+KEY_F15 = Key.KEY_F15
+KEY_F16 = Key.KEY_F16
+KEY_F17 = Key.KEY_F17
+KEY_F18 = Key.KEY_F18
+KEY_F19 = Key.KEY_F19
+KEY_F20 = Key.KEY_F20
+KEY_F21 = Key.KEY_F21
+KEY_F22 = Key.KEY_F22
+KEY_F23 = Key.KEY_F23
+KEY_F24 = Key.KEY_F24
+KEY_F25 = Key.KEY_F25
+KEY_UP = Key.KEY_UP
+KEY_DOWN = Key.KEY_DOWN
+KEY_LEFT = Key.KEY_LEFT
+KEY_RIGHT = Key.KEY_RIGHT
+KEY_LSHIFT = Key.KEY_LSHIFT
+KEY_RSHIFT = Key.KEY_RSHIFT
+KEY_LCTRL = Key.KEY_LCTRL
+KEY_RCTRL = Key.KEY_RCTRL
+KEY_LALT = Key.KEY_LALT
+KEY_RALT = Key.KEY_RALT
+KEY_TAB = Key.KEY_TAB
+KEY_ENTER = Key.KEY_ENTER
+KEY_BACKSPACE = Key.KEY_BACKSPACE
+KEY_INSERT = Key.KEY_INSERT
+KEY_DEL = Key.KEY_DEL
+KEY_PAGEUP = Key.KEY_PAGEUP
+KEY_PAGEDOWN = Key.KEY_PAGEDOWN
+KEY_HOME = Key.KEY_HOME
+KEY_END = Key.KEY_END
+KEY_KP_0 = Key.KEY_KP_0
+KEY_KP_1 = Key.KEY_KP_1
+KEY_KP_2 = Key.KEY_KP_2
+KEY_KP_3 = Key.KEY_KP_3
+KEY_KP_4 = Key.KEY_KP_4
+KEY_KP_5 = Key.KEY_KP_5
+KEY_KP_6 = Key.KEY_KP_6
+KEY_KP_7 = Key.KEY_KP_7
+KEY_KP_8 = Key.KEY_KP_8
+KEY_KP_9 = Key.KEY_KP_9
+KEY_KP_DIVIDE = Key.KEY_KP_DIVIDE
+KEY_KP_MULTIPLY = Key.KEY_KP_MULTIPLY
+KEY_KP_SUBTRACT = Key.KEY_KP_SUBTRACT
+KEY_KP_ADD = Key.KEY_KP_ADD
+KEY_KP_DECIMAL = Key.KEY_KP_DECIMAL
+KEY_KP_EQUAL = Key.KEY_KP_EQUAL
+KEY_KP_ENTER = Key.KEY_KP_ENTER
+KEY_KP_NUM_LOCK = Key.KEY_KP_NUM_LOCK
+KEY_CAPS_LOCK = Key.KEY_CAPS_LOCK
+KEY_SCROLL_LOCK = Key.KEY_SCROLL_LOCK
+KEY_PAUSE = Key.KEY_PAUSE
+KEY_LSUPER = Key.KEY_LSUPER
+KEY_RSUPER = Key.KEY_RSUPER
+KEY_MENU = Key.KEY_MENU
+KEY_LAST = Key.KEY_LAST
+
 
 # mouse button definitions
-MOUSE_BUTTON_1 = 0
-MOUSE_BUTTON_2 = 1
-MOUSE_BUTTON_3 = 2
-MOUSE_BUTTON_4 = 3
-MOUSE_BUTTON_5 = 4
-MOUSE_BUTTON_6 = 5
-MOUSE_BUTTON_7 = 6
-MOUSE_BUTTON_8 = 7
-MOUSE_BUTTON_LAST = MOUSE_BUTTON_8
-
-# mouse button aliases
-MOUSE_BUTTON_LEFT = MOUSE_BUTTON_1
-MOUSE_BUTTON_RIGHT = MOUSE_BUTTON_2
-MOUSE_BUTTON_MIDDLE = MOUSE_BUTTON_3
+class MouseButton(_enum.IntEnum):
+    """Mouse buttons, for use with glfw.GetMouseButton and the mouse button callback."""
+    
+    MOUSE_BUTTON_1 = 0
+    MOUSE_BUTTON_2 = 1
+    MOUSE_BUTTON_3 = 2
+    MOUSE_BUTTON_4 = 3
+    MOUSE_BUTTON_5 = 4
+    MOUSE_BUTTON_6 = 5
+    MOUSE_BUTTON_7 = 6
+    MOUSE_BUTTON_8 = 7
+    MOUSE_BUTTON_LAST = MOUSE_BUTTON_8
+
+    # mouse button aliases
+    MOUSE_BUTTON_LEFT = MOUSE_BUTTON_1
+    MOUSE_BUTTON_RIGHT = MOUSE_BUTTON_2
+    MOUSE_BUTTON_MIDDLE = MOUSE_BUTTON_3
+
+# module level aliases
+MOUSE_BUTTON_1 = MouseButton.MOUSE_BUTTON_1
+MOUSE_BUTTON_2 = MouseButton.MOUSE_BUTTON_2
+MOUSE_BUTTON_3 = MouseButton.MOUSE_BUTTON_3
+MOUSE_BUTTON_4 = MouseButton.MOUSE_BUTTON_4
+MOUSE_BUTTON_5 = MouseButton.MOUSE_BUTTON_5
+MOUSE_BUTTON_6 = MouseButton.MOUSE_BUTTON_6
+MOUSE_BUTTON_7 = MouseButton.MOUSE_BUTTON_7
+MOUSE_BUTTON_8 = MouseButton.MOUSE_BUTTON_8
+MOUSE_BUTTON_LAST = MouseButton.MOUSE_BUTTON_LAST
+MOUSE_BUTTON_LEFT = MouseButton.MOUSE_BUTTON_LEFT
+MOUSE_BUTTON_RIGHT = MouseButton.MOUSE_BUTTON_RIGHT
+MOUSE_BUTTON_MIDDLE = MouseButton.MOUSE_BUTTON_MIDDLE
+
 
 # joystick identifiers
-JOYSTICK_1 = 0
-JOYSTICK_2 = 1
-JOYSTICK_3 = 2
-JOYSTICK_4 = 3
-JOYSTICK_5 = 4
-JOYSTICK_6 = 5
-JOYSTICK_7 = 6
-JOYSTICK_8 = 7
-JOYSTICK_9 = 8
-JOYSTICK_10 = 9
-JOYSTICK_11 = 10
-JOYSTICK_12 = 11
-JOYSTICK_13 = 12
-JOYSTICK_14 = 13
-JOYSTICK_15 = 14
-JOYSTICK_16 = 15
-JOYSTICK_LAST = JOYSTICK_16
+class Joystick(_enum.IntEnum):
+    """Joystick identifiers, for use with the glfw.GetJoystick* functions."""
+    
+    JOYSTICK_1 = 0
+    JOYSTICK_2 = 1
+    JOYSTICK_3 = 2
+    JOYSTICK_4 = 3
+    JOYSTICK_5 = 4
+    JOYSTICK_6 = 5
+    JOYSTICK_7 = 6
+    JOYSTICK_8 = 7
+    JOYSTICK_9 = 8
+    JOYSTICK_10 = 9
+    JOYSTICK_11 = 10
+    JOYSTICK_12 = 11
+    JOYSTICK_13 = 12
+    JOYSTICK_14 = 13
+    JOYSTICK_15 = 14
+    JOYSTICK_16 = 15
+    JOYSTICK_LAST = JOYSTICK_16
+
+# module level aliases
+JOYSTICK_1 = Joystick.JOYSTICK_1
+JOYSTICK_2 = Joystick.JOYSTICK_2
+JOYSTICK_3 = Joystick.JOYSTICK_3
+JOYSTICK_4 = Joystick.JOYSTICK_4
+JOYSTICK_5 = Joystick.JOYSTICK_5
+JOYSTICK_6 = Joystick.JOYSTICK_6
+JOYSTICK_7 = Joystick.JOYSTICK_7
+JOYSTICK_8 = Joystick.JOYSTICK_8
+JOYSTICK_9 = Joystick.JOYSTICK_9
+JOYSTICK_10 = Joystick.JOYSTICK_10
+JOYSTICK_11 = Joystick.JOYSTICK_11
+JOYSTICK_12 = Joystick.JOYSTICK_12
+JOYSTICK_13 = Joystick.JOYSTICK_13
+JOYSTICK_14 = Joystick.JOYSTICK_14
+JOYSTICK_15 = Joystick.JOYSTICK_15
+JOYSTICK_16 = Joystick.JOYSTICK_16
+JOYSTICK_LAST = Joystick.JOYSTICK_LAST
+
 
 # glfw.OpenWindow modes
 WINDOW = 0x00010001
 FULLSCREEN = 0x00010002
 
+
 # glfw.GetWindowParam tokens
-OPENED = 0x00020001
-ACTIVE = 0x00020002
-ICONIFIED = 0x00020003
-ACCELERATED = 0x00020004
-RED_BITS = 0x00020005
-GREEN_BITS = 0x00020006
-BLUE_BITS = 0x00020007
-ALPHA_BITS = 0x00020008
-DEPTH_BITS = 0x00020009
-STENCIL_BITS = 0x0002000A
-
-# the following constants are used for both glfw.GetWindowParam
-# and glfw.OpenWindowHint
-REFRESH_RATE = 0x0002000B
-ACCUM_RED_BITS = 0x0002000C
-ACCUM_GREEN_BITS = 0x0002000D
-ACCUM_BLUE_BITS = 0x0002000E
-ACCUM_ALPHA_BITS = 0x0002000F
-AUX_BUFFERS = 0x00020010
-STEREO = 0x00020011
-WINDOW_NO_RESIZE = 0x00020012
-FSAA_SAMPLES = 0x00020013
-OPENGL_VERSION_MAJOR = 0x00020014
-OPENGL_VERSION_MINOR = 0x00020015
-OPENGL_FORWARD_COMPAT = 0x00020016
-OPENGL_DEBUG_CONTEXT = 0x00020017
-OPENGL_PROFILE = 0x00020018
+class WindowParam(_enum.IntEnum):
+    """glfw.GetWindowParam tokens, some of which are also glfw.OpenWindowHint targets."""
+    
+    OPENED = 0x00020001
+    ACTIVE = 0x00020002
+    ICONIFIED = 0x00020003
+    ACCELERATED = 0x00020004
+    RED_BITS = 0x00020005
+    GREEN_BITS = 0x00020006
+    BLUE_BITS = 0x00020007
+    ALPHA_BITS = 0x00020008
+    DEPTH_BITS = 0x00020009
+    STENCIL_BITS = 0x0002000A
+
+    # the following constants are used for both glfw.GetWindowParam
+    # and glfw.OpenWindowHint
+    REFRESH_RATE = 0x0002000B
+    ACCUM_RED_BITS = 0x0002000C
+    ACCUM_GREEN_BITS = 0x0002000D
+    ACCUM_BLUE_BITS = 0x0002000E
+    ACCUM_ALPHA_BITS = 0x0002000F
+    AUX_BUFFERS = 0x00020010
+    STEREO = 0x00020011
+    WINDOW_NO_RESIZE = 0x00020012
+    FSAA_SAMPLES = 0x00020013
+    OPENGL_VERSION_MAJOR = 0x00020014
+    OPENGL_VERSION_MINOR = 0x00020015
+    OPENGL_FORWARD_COMPAT = 0x00020016
+    OPENGL_DEBUG_CONTEXT = 0x00020017
+    OPENGL_PROFILE = 0x00020018
+
+# module level aliases
+OPENED = WindowParam.OPENED
+ACTIVE = WindowParam.ACTIVE
+ICONIFIED = WindowParam.ICONIFIED
+ACCELERATED = WindowParam.ACCELERATED
+RED_BITS = WindowParam.RED_BITS
+GREEN_BITS = WindowParam.GREEN_BITS
+BLUE_BITS = WindowParam.BLUE_BITS
+ALPHA_BITS = WindowParam.ALPHA_BITS
+DEPTH_BITS = WindowParam.DEPTH_BITS
+STENCIL_BITS = WindowParam.STENCIL_BITS
+REFRESH_RATE = WindowParam.REFRESH_RATE
+ACCUM_RED_BITS = WindowParam.ACCUM_RED_BITS
+ACCUM_GREEN_BITS = WindowParam.ACCUM_GREEN_BITS
+ACCUM_BLUE_BITS = WindowParam.ACCUM_BLUE_BITS
+ACCUM_ALPHA_BITS = WindowParam.ACCUM_ALPHA_BITS
+AUX_BUFFERS = WindowParam.AUX_BUFFERS
+STEREO = WindowParam.STEREO
+WINDOW_NO_RESIZE = WindowParam.WINDOW_NO_RESIZE
+FSAA_SAMPLES = WindowParam.FSAA_SAMPLES
+OPENGL_VERSION_MAJOR = WindowParam.OPENGL_VERSION_MAJOR
+OPENGL_VERSION_MINOR = WindowParam.OPENGL_VERSION_MINOR
+OPENGL_FORWARD_COMPAT = WindowParam.OPENGL_FORWARD_COMPAT
+OPENGL_DEBUG_CONTEXT = WindowParam.OPENGL_DEBUG_CONTEXT
+OPENGL_PROFILE = WindowParam.OPENGL_PROFILE
+
+# valid glfw.OpenWindowHint targets and glfw.GetWindowParam tokens, kept as
+# frozensets so validating them is a single hashed lookup
+_VALID_WINDOW_HINT_TARGETS = frozenset([
+    REFRESH_RATE,
+    ACCUM_RED_BITS, ACCUM_GREEN_BITS, ACCUM_BLUE_BITS, ACCUM_ALPHA_BITS,
+    AUX_BUFFERS, STEREO, WINDOW_NO_RESIZE, FSAA_SAMPLES,
+    OPENGL_VERSION_MAJOR, OPENGL_VERSION_MINOR, OPENGL_FORWARD_COMPAT,
+    OPENGL_DEBUG_CONTEXT, OPENGL_PROFILE
+])
+_VALID_WINDOW_PARAMS = _VALID_WINDOW_HINT_TARGETS | frozenset([
+    OPENED, ACTIVE, ICONIFIED, ACCELERATED, RED_BITS, GREEN_BITS, BLUE_BITS,
+    ALPHA_BITS, DEPTH_BITS, STENCIL_BITS
+])
 
 # glfw.OPENGL_PROFILE tokens
 OPENGL_CORE_PROFILE = 0x00050001
@@ -321,17 +541,26 @@ SYSTEM_KEYS = 0x00030004
 KEY_REPEAT = 0x00030005
 AUTO_POLL_EVENTS = 0x00030006
 
+_VALID_ENABLE_TOKENS = frozenset([
+    MOUSE_CURSOR, STICKY_KEYS, STICKY_MOUSE_BUTTONS, SYSTEM_KEYS, KEY_REPEAT, AUTO_POLL_EVENTS
+])
+
 # glfw.GetJoystickParam tokens
 PRESENT = 0x00050001
 AXES = 0x00050002
 BUTTONS = 0x00050003
 
+_VALID_JOYSTICK_PARAMS = frozenset([PRESENT, AXES, BUTTONS])
+
 
 ##############
 # structures #
 ##############
 
 class vidmode(object):
+    # GetVideoModes creates a bunch of these, no need for a __dict__ on each
+    __slots__ = ("Width", "Height", "RedBits", "GreenBits", "BlueBits")
+    
     def __init__(self, Width, Height, RedBits, GreenBits, BlueBits):
         self.Width = Width
         self.Height = Height
@@ -342,7 +571,8 @@ class vidmode(object):
     def __repr__(self):
         return "glfw.vidmode(%d, %d, %d, %d, %d)" % (self.Width, self.Height, self.RedBits, self.GreenBits, self.BlueBits)
     
-    # C vidmode struct
+    # C vidmode struct - note that GLFWvidmode in glfw.h declares BlueBits before
+    # GreenBits, the field order below must match that exactly
     class _struct(_ctypes.Structure):
         _fields_ = [
             ("Width", _ctypes.c_int),
@@ -357,139 +587,282 @@ class vidmode(object):
 # functions #
 #############
 
-# First we define all the appropriate ctypes function definitions, then we write
-# Python wrappers for all functions. We write wrapper functions for all
-# ctypes functions, regardless if it's necessary or not, to give everything
-# a Python feel (call overhead is pretty much irrelevant for a windowing
-# library like GLFW.)
+# First we declare all GLFW functions in a table (_FUNC_DEFS), which gets bound
+# to the _glfwFooBar names when the library is first used, then we write Python
+# wrappers for all functions to give everything a Python feel. Some of these
+# (SwapBuffers, PollEvents, GetKey, ...) typically run every frame, so their
+# call overhead does matter and they're kept as thin as possible.
 
 import os
-import warnings
 
-# load the GLFW shared library
+# helper function for typedefs
+# these are different thanks to different calling conventions
 if os.name == "nt":
-    try:
-        _glfwdll = _ctypes.windll.LoadLibrary(os.path.join(os.path.dirname(os.path.abspath(__file__)), "glfw.dll"))
-    except:
-        # make dll searching a bit more like windows does it
-        # save path
-        old_path = os.environ["PATH"]
-        
-        # add the directory containing the main script to path, if any
-        import __main__
-        if hasattr(__main__, "__file__") and __main__.__file__:
-            os.environ["PATH"] = os.path.dirname(os.path.abspath(__main__.__file__)) + os.pathsep + os.environ["PATH"]
-        del __main__
-        
-        # add cwd to path
-        os.environ["PATH"] = os.path.abspath(".") + os.pathsep + os.environ["PATH"]
-        
-        # try to find the library
-        glfw_loc = _find_library("glfw")
-        
-        # restore old path
-        os.environ["PATH"] = old_path
-        del old_path
-        
-        if glfw_loc is None:
-            raise RuntimeError("no GLFW shared library found")
-        else:
-            warnings.warn("no GLFW shared library found in the module directory, using the system's library", RuntimeWarning)
-            _glfwdll = _ctypes.windll.LoadLibrary(glfw_loc)
-        
-        del glfw_loc
+    func_typedef = _ctypes.WINFUNCTYPE
 else:
-    try:
-        _glfwdll = _ctypes.cdll.LoadLibrary(os.path.abspath(os.path.join(os.path.dirname(__file__), "libglfw.so")))
-    except:
+    func_typedef = _ctypes.CFUNCTYPE
+    
+del os
+
+# callback function typedefs, named after the GLFW typedefs - they are used as
+# the argument types of the callback setters
+_GLFWwindowsizefun = func_typedef(None, _ctypes.c_int, _ctypes.c_int)
+_GLFWwindowclosefun = func_typedef(_ctypes.c_int)
+_GLFWwindowrefreshfun = func_typedef(None)
+_GLFWkeyfun = func_typedef(None, _ctypes.c_int, _ctypes.c_int)
+_GLFWcharfun = func_typedef(None, _ctypes.c_int, _ctypes.c_int)
+_GLFWmousebuttonfun = func_typedef(None, _ctypes.c_int, _ctypes.c_int)
+_GLFWmouseposfun = func_typedef(None, _ctypes.c_int, _ctypes.c_int)
+_GLFWmousewheelfun = func_typedef(None, _ctypes.c_int)
+
+
+# int* out-parameters, GLFW 2.7.5 has no window handles - the window is global
+_c_int_p = _ctypes.POINTER(_ctypes.c_int)
+
+# GLFW function declarations, restype before the function like in C
+_FUNC_DEFS = (
+    # GLFW initialization, termination and version querying
+    (_ctypes.c_int, "glfwInit", ()),
+    (None, "glfwTerminate", ()),
+    (None, "glfwGetVersion", (_c_int_p, _c_int_p, _c_int_p)),
+
+    # window handling
+    (_ctypes.c_int, "glfwOpenWindow", (_ctypes.c_int, _ctypes.c_int, _ctypes.c_int, _ctypes.c_int, _ctypes.c_int, _ctypes.c_int, _ctypes.c_int, _ctypes.c_int, _ctypes.c_int)),
+    (None, "glfwOpenWindowHint", (_ctypes.c_int, _ctypes.c_int)),
+    (None, "glfwCloseWindow", ()),
+    (None, "glfwSetWindowTitle", (_ctypes.c_char_p,)),
+    (None, "glfwGetWindowSize", (_c_int_p, _c_int_p)),
+    (None, "glfwSetWindowSize", (_ctypes.c_int, _ctypes.c_int)),
+    (None, "glfwSetWindowPos", (_ctypes.c_int, _ctypes.c_int)),
+    (None, "glfwIconifyWindow", ()),
+    (None, "glfwRestoreWindow", ()),
+    (None, "glfwSwapBuffers", ()),
+    (None, "glfwSwapInterval", (_ctypes.c_int,)),
+    (_ctypes.c_int, "glfwGetWindowParam", (_ctypes.c_int,)),
+    (None, "glfwSetWindowSizeCallback", (_GLFWwindowsizefun,)),
+    (None, "glfwSetWindowCloseCallback", (_GLFWwindowclosefun,)),
+    (None, "glfwSetWindowRefreshCallback", (_GLFWwindowrefreshfun,)),
+
+    # video mode functions
+    (_ctypes.c_int, "glfwGetVideoModes", (_ctypes.POINTER(vidmode._struct), _ctypes.c_int)),
+    (None, "glfwGetDesktopMode", (_ctypes.POINTER(vidmode._struct),)),
+
+    # input handling
+    (None, "glfwPollEvents", ()),
+    (None, "glfwWaitEvents", ()),
+    (_ctypes.c_int, "glfwGetKey", (_ctypes.c_int,)),
+    (_ctypes.c_int, "glfwGetMouseButton", (_ctypes.c_int,)),
+    (None, "glfwGetMousePos", (_c_int_p, _c_int_p)),
+    (None, "glfwSetMousePos", (_ctypes.c_int, _ctypes.c_int)),
+    (_ctypes.c_int, "glfwGetMouseWheel", ()),
+    (None, "glfwSetMouseWheel", (_ctypes.c_int,)),
+    (None, "glfwSetKeyCallback", (_GLFWkeyfun,)),
+    (None, "glfwSetCharCallback", (_GLFWcharfun,)),
+    (None, "glfwSetMouseButtonCallback", (_GLFWmousebuttonfun,)),
+    (None, "glfwSetMousePosCallback", (_GLFWmouseposfun,)),
+    (None, "glfwSetMouseWheelCallback", (_GLFWmousewheelfun,)),
+
+    # extension support
+    (_ctypes.c_int, "glfwExtensionSupported", (_ctypes.c_char_p,)),
+    (_ctypes.c_void_p, "glfwGetProcAddress", (_ctypes.c_char_p,)),
+    (None, "glfwGetGLVersion", (_c_int_p, _c_int_p, _c_int_p)),
+
+    # joystick input
+    (_ctypes.c_int, "glfwGetJoystickParam", (_ctypes.c_int, _ctypes.c_int)),
+    (_ctypes.c_int, "glfwGetJoystickPos", (_ctypes.c_int, _ctypes.POINTER(_ctypes.c_float), _ctypes.c_int)),
+    (_ctypes.c_int, "glfwGetJoystickButtons", (_ctypes.c_int, _ctypes.POINTER(_ctypes.c_ubyte), _ctypes.c_int)),
+
+    # enable/disable functions
+    (None, "glfwEnable", (_ctypes.c_int,)),
+    (None, "glfwDisable", (_ctypes.c_int,)),
+)
+
+# The shared library is loaded on first use rather than on import, so merely
+# importing glfw (say, for the constants) doesn't pay for it. Until then the
+# _glfwFooBar names are stand-ins which load the library when called.
+_glfwdll = None
+
+
+def _open_library():
+    """Finds and opens the GLFW shared library."""
+    
+    import os
+    import warnings
+    
+    if os.name == "nt":
         try:
-            _glfwdll = _ctypes.cdll.LoadLibrary(os.path.abspath(os.path.join(os.path.dirname(__file__), "libglfw.dylib")))
+            return _ctypes.windll.LoadLibrary(os.path.join(os.path.dirname(os.path.abspath(__file__)), "glfw.dll"))
         except:
+            # make dll searching a bit more like windows does it
+            # save path
+            old_path = os.environ["PATH"]
+            
+            # add the directory containing the main script to path, if any
+            import __main__
+            if hasattr(__main__, "__file__") and __main__.__file__:
+                os.environ["PATH"] = os.path.dirname(os.path.abspath(__main__.__file__)) + os.pathsep + os.environ["PATH"]
+            
+            # add cwd to path
+            os.environ["PATH"] = os.path.abspath(".") + os.pathsep + os.environ["PATH"]
+            
+            # try to find the library
             glfw_loc = _find_library("glfw")
             
+            # restore old path
+            os.environ["PATH"] = old_path
+            
             if glfw_loc is None:
                 raise RuntimeError("no GLFW shared library found")
-            else:
-                warnings.warn("no GLFW shared library found in the module directory, using the system's library", RuntimeWarning)
-                _glfwdll = _ctypes.cdll.LoadLibrary(glfw_loc)
+            
+            warnings.warn("no GLFW shared library found in the module directory, using the system's library", RuntimeWarning)
+            return _ctypes.windll.LoadLibrary(glfw_loc)
+    else:
+        try:
+            return _ctypes.cdll.LoadLibrary(os.path.abspath(os.path.join(os.path.dirname(__file__), "libglfw.so")))
+        except:
+            try:
+                return _ctypes.cdll.LoadLibrary(os.path.abspath(os.path.join(os.path.dirname(__file__), "libglfw.dylib")))
+            except:
+                glfw_loc = _find_library("glfw")
                 
-            del glfw_loc
+                if glfw_loc is None:
+                    raise RuntimeError("no GLFW shared library found")
+                
+                warnings.warn("no GLFW shared library found in the module directory, using the system's library", RuntimeWarning)
+                return _ctypes.cdll.LoadLibrary(glfw_loc)
+
+
+def _load_library():
+    """Loads the GLFW shared library, if that hasn't happened yet.
     
-# helper function for typedefs
-# these are different thanks to different calling conventions
-if os.name == "nt":
-    func_typedef = _ctypes.WINFUNCTYPE
-else:
-    func_typedef = _ctypes.CFUNCTYPE
+    All functions in _FUNC_DEFS get declared in a single pass and bound to
+    their module level names (_glfwFooBar), replacing the stand-ins. This way
+    the wrappers skip the attribute lookup on the library object on every call.
+    """
     
-del warnings
-del os
+    global _glfwdll
+    
+    if _glfwdll is not None:
+        return
+    
+    dll = _open_library()
+    
+    module = globals()
+    for restype, name, argtypes in _FUNC_DEFS:
+        func = getattr(dll, name)
+        func.restype = restype
+        func.argtypes = argtypes
+        module["_" + name] = func
+    
+    # If asked to through the PYGLFW_USE_CFFI environment variable, the
+    # functions only taking and returning ints go through cffi instead. Calls
+    # through cffi have less overhead than ctypes calls (a lot less on PyPy.)
+    # They are replacements for the ctypes functions bound above, so their
+    # declarations are derived from _FUNC_DEFS - but cffi reports bad arguments
+    # differently (OverflowError instead of truncating, TypeError instead of
+    # ctypes.ArgumentError), which is why it's opt-in. Any failure setting cffi
+    # up warns and leaves the ctypes functions in place.
+    import os
+    
+    if os.environ.get("PYGLFW_USE_CFFI", "") not in ("", "0"):
+        try:
+            import cffi
+            
+            ctypes_to_c = {None: "void", _ctypes.c_int: "int"}
+            prototypes = []
+            names = []
+            for restype, name, argtypes in _FUNC_DEFS:
+                if restype in ctypes_to_c and all(argtype is _ctypes.c_int for argtype in argtypes):
+                    # WINAPI is only meaningful on 32-bit Windows, cffi ignores it elsewhere
+                    prototypes.append("%s WINAPI %s(%s);" % (ctypes_to_c[restype], name, ", ".join(["int"] * len(argtypes)) or "void"))
+                    names.append(name)
+            
+            ffi = cffi.FFI()
+            ffi.cdef("\n".join(prototypes))
+            ffilib = ffi.dlopen(dll._name)
+            
+            ffi_funcs = [(name, getattr(ffilib, name)) for name in names]
+        except Exception as e:
+            import warnings
+            warnings.warn("couldn't set up cffi, using ctypes: %s" % e, RuntimeWarning)
+        else:
+            for name, func in ffi_funcs:
+                module["_" + name] = func
+    
+    _specialize_wrappers()
+    
+    _glfwdll = dll
 
 
-# helper function for function declarations
-# restype before the function, like in C declarations
-def func_def(restype, func, *argtypes):
-    func.restype = restype
-    func.argtypes = list(argtypes)
-    
-    return func
-    
-    
-# GLFW initialization, termination and version querying
-func_def(_ctypes.c_int, _glfwdll.glfwInit)
-func_def(None, _glfwdll.glfwTerminate)
-func_def(None, _glfwdll.glfwGetVersion, _ctypes.POINTER(_ctypes.c_int), _ctypes.POINTER(_ctypes.c_int), _ctypes.POINTER(_ctypes.c_int))
-
-# window handling
-func_def(_ctypes.c_int, _glfwdll.glfwOpenWindow, _ctypes.c_int, _ctypes.c_int, _ctypes.c_int, _ctypes.c_int, _ctypes.c_int, _ctypes.c_int, _ctypes.c_int, _ctypes.c_int, _ctypes.c_int)
-func_def(None, _glfwdll.glfwOpenWindowHint, _ctypes.c_int, _ctypes.c_int)
-func_def(None, _glfwdll.glfwCloseWindow)
-func_def(None, _glfwdll.glfwSetWindowTitle, _ctypes.c_char_p)
-func_def(None, _glfwdll.glfwGetWindowSize, _ctypes.POINTER(_ctypes.c_int), _ctypes.POINTER(_ctypes.c_int))
-func_def(None, _glfwdll.glfwSetWindowSize, _ctypes.c_int, _ctypes.c_int)
-func_def(None, _glfwdll.glfwSetWindowPos, _ctypes.c_int, _ctypes.c_int)
-func_def(None, _glfwdll.glfwIconifyWindow)
-func_def(None, _glfwdll.glfwRestoreWindow)
-func_def(None, _glfwdll.glfwSwapBuffers)
-func_def(None, _glfwdll.glfwSwapInterval, _ctypes.c_int)
-func_def(_ctypes.c_int, _glfwdll.glfwGetWindowParam, _ctypes.c_int)
-# we pass callback functions as void pointers because the prototypes are defined at the wrapper functions themselves
-func_def(None, _glfwdll.glfwSetWindowSizeCallback, _ctypes.c_void_p)
-func_def(None, _glfwdll.glfwSetWindowCloseCallback, _ctypes.c_void_p)
-func_def(None, _glfwdll.glfwSetWindowRefreshCallback, _ctypes.c_void_p)
-
-# video mode functions
-func_def(_ctypes.c_int, _glfwdll.glfwGetVideoModes, _ctypes.POINTER(vidmode._struct), _ctypes.c_int);
-func_def(None, _glfwdll.glfwGetDesktopMode, _ctypes.POINTER(vidmode._struct))
-
-# input handling
-func_def(None, _glfwdll.glfwPollEvents)
-func_def(None, _glfwdll.glfwWaitEvents)
-func_def(_ctypes.c_int, _glfwdll.glfwGetKey, _ctypes.c_int)
-func_def(_ctypes.c_int, _glfwdll.glfwGetMouseButton, _ctypes.c_int)
-func_def(None, _glfwdll.glfwGetMousePos, _ctypes.POINTER(_ctypes.c_int), _ctypes.POINTER(_ctypes.c_int))
-func_def(None, _glfwdll.glfwSetMousePos, _ctypes.c_int, _ctypes.c_int)
-func_def(_ctypes.c_int, _glfwdll.glfwGetMouseWheel)
-func_def(None, _glfwdll.glfwSetMouseWheel, _ctypes.c_int)
-func_def(None, _glfwdll.glfwSetKeyCallback, _ctypes.c_void_p)
-func_def(None, _glfwdll.glfwSetCharCallback, _ctypes.c_void_p)
-func_def(None, _glfwdll.glfwSetMouseButtonCallback, _ctypes.c_void_p)
-func_def(None, _glfwdll.glfwSetMousePosCallback, _ctypes.c_void_p)
-func_def(None, _glfwdll.glfwSetMouseWheelCallback, _ctypes.c_void_p)
-
-# extension support
-func_def(_ctypes.c_int, _glfwdll.glfwExtensionSupported, _ctypes.c_char_p)
-func_def(_ctypes.c_void_p, _glfwdll.glfwGetProcAddress, _ctypes.c_char_p)
-func_def(None, _glfwdll.glfwGetGLVersion, _ctypes.POINTER(_ctypes.c_int), _ctypes.POINTER(_ctypes.c_int), _ctypes.POINTER(_ctypes.c_int))
-
-# joystick input
-func_def(_ctypes.c_int, _glfwdll.glfwGetJoystickParam, _ctypes.c_int, _ctypes.c_int)
-func_def(_ctypes.c_int, _glfwdll.glfwGetJoystickPos, _ctypes.c_int, _ctypes.POINTER(_ctypes.c_float), _ctypes.c_int)
-func_def(_ctypes.c_int, _glfwdll.glfwGetJoystickButtons, _ctypes.c_int, _ctypes.POINTER(_ctypes.c_ubyte), _ctypes.c_int)
-
-# enable/disable functions
-func_def(None, _glfwdll.glfwEnable, _ctypes.c_int)
-func_def(None, _glfwdll.glfwDisable, _ctypes.c_int)
+# The wrappers that do nothing but call into GLFW without arguments. They're
+# only defined here, as closures over the stand-ins below, and rebound to
+# closures over the loaded functions once the library is loaded, which saves the
+# global lookup on every call.
+_PASSTHROUGH_WRAPPERS = (
+    "SwapBuffers", "PollEvents", "WaitEvents", "IconifyWindow", "RestoreWindow", "GetMouseWheel"
+)
+
+
+def _make_passthrough_wrapper(name, func):
+    """Returns a wrapper called name, calling func without arguments."""
+    
+    def wrapper():
+        return func()
+    
+    wrapper.__name__ = wrapper.__qualname__ = name
+    
+    return wrapper
+
+
+def _specialize_wrappers():
+    """Replaces the pass-through wrappers with closures over the loaded functions."""
+    
+    module = globals()
+    for name in _PASSTHROUGH_WRAPPERS:
+        module[name] = _make_passthrough_wrapper(name, module["_glfw" + name])
+
+
+class _LazyFunction(object):
+    """Stand-in for a GLFW function, loading the shared library when called."""
+    
+    def __init__(self, name):
+        self.name = name
+    
+    def __call__(self, *args):
+        _load_library()
+        
+        return globals()["_" + self.name](*args)
+    
+    def __repr__(self):
+        return "glfw._LazyFunction(%s)" % repr(self.name)
+
+
+for _name in [func_def[1] for func_def in _FUNC_DEFS]:
+    globals()["_" + _name] = _LazyFunction(_name)
+
+del _name
+
+_specialize_wrappers()
+
+
+# Scratch buffers for the functions returning values through pointers. These
+# (and their byref wrappers) are created once instead of on every call. This
+# isn't thread-safe, but then neither is GLFW 2.7.5's single window API.
+# GLFW leaves the outputs untouched when there's no window open, so functions
+# that depend on a window must clear the buffers before the call.
+# The ints are views into one buffer, so the results are read with a single
+# struct unpack instead of a .value access per int.
+_scratch_ints = (_ctypes.c_int * 3)()
+_scratch_int_a = _ctypes.c_int.from_buffer(_scratch_ints, 0)
+_scratch_int_b = _ctypes.c_int.from_buffer(_scratch_ints, _ctypes.sizeof(_ctypes.c_int))
+_scratch_int_c = _ctypes.c_int.from_buffer(_scratch_ints, 2 * _ctypes.sizeof(_ctypes.c_int))
+_unpack_int2 = _struct.Struct("2i").unpack_from
+_unpack_int3 = _struct.Struct("3i").unpack_from
+_scratch_int_a_ref = _ctypes.byref(_scratch_int_a)
+_scratch_int_b_ref = _ctypes.byref(_scratch_int_b)
+_scratch_int_c_ref = _ctypes.byref(_scratch_int_c)
+_scratch_vidmode = vidmode._struct()
+_scratch_vidmode_ref = _ctypes.byref(_scratch_vidmode)
 
 
 # Normally argument checking is a no-go in Python (duck typing), but we're dealing 
@@ -510,35 +883,33 @@ class OpeningWindowError(Exception):
 
 
 def Init():
-    if not _glfwdll.glfwInit():
+    if not _glfwInit():
         raise InitError("couldn't initialize GLFW")
 
         
 def Terminate():
-    _glfwdll.glfwTerminate()
+    _glfwTerminate()
+    ExtensionSupported._cache.clear()
     
     
 def GetVersion():
-    major, minor, rev = _ctypes.c_int(), _ctypes.c_int(), _ctypes.c_int()
-    
-    _glfwdll.glfwGetVersion(_ctypes.byref(major), _ctypes.byref(minor), _ctypes.byref(rev))
+    # the library version can't change while we're running, so only ask once
+    if GetVersion._version is None:
+        _glfwGetVersion(_scratch_int_a_ref, _scratch_int_b_ref, _scratch_int_c_ref)
+        GetVersion._version = _unpack_int3(_scratch_ints)
     
-    return (major.value, minor.value, rev.value)
+    return GetVersion._version
+
+GetVersion._version = None
 
 def OpenWindowHint(target, hint):
     if not _is_int(target) or not _is_int(hint):
         raise TypeError("target and hint must be numbers")
 
-    if target not in (
-        REFRESH_RATE,
-        ACCUM_RED_BITS, ACCUM_GREEN_BITS, ACCUM_BLUE_BITS, ACCUM_ALPHA_BITS,
-        AUX_BUFFERS, STEREO, WINDOW_NO_RESIZE, FSAA_SAMPLES,
-        OPENGL_VERSION_MAJOR, OPENGL_VERSION_MINOR, OPENGL_FORWARD_COMPAT,
-        OPENGL_DEBUG_CONTEXT, OPENGL_PROFILE
-        ):
+    if target not in _VALID_WINDOW_HINT_TARGETS:
         raise ValueError("invalid target parameter")
 
-    return _glfwdll.glfwOpenWindowHint(target, hint)
+    return _glfwOpenWindowHint(target, hint)
     
 
 def OpenWindow(width, height, redbits, greenbits, bluebits, alphabits, depthbits, stencilbits, mode):
@@ -566,28 +937,34 @@ def OpenWindow(width, height, redbits, greenbits, bluebits, alphabits, depthbits
     if mode not in (WINDOW, FULLSCREEN):
         raise ValueError("mode must be equal to WINDOW or FULLSCREEN")
     
-    opened = _glfwdll.glfwOpenWindow(int(width), int(height), redbits, greenbits, bluebits, alphabits, depthbits, stencilbits, mode)
+    opened = _glfwOpenWindow(int(width), int(height), redbits, greenbits, bluebits, alphabits, depthbits, stencilbits, mode)
+    ExtensionSupported._cache.clear()
     
     if not opened:
         raise OpeningWindowError("couldn't open GLFW window")
 
         
 def CloseWindow():
-    _glfwdll.glfwCloseWindow()
+    _glfwCloseWindow()
+    ExtensionSupported._cache.clear()
     
     
 def SetWindowTitle(title):
-    title = title.encode("latin-1")
+    # already encoded titles are passed through as is
+    if not isinstance(title, bytes):
+        if not isinstance(title, str):
+            raise TypeError("title must be a string")
+        
+        title = _encode_latin1(title)
     
-    _glfwdll.glfwSetWindowTitle(title)
+    _glfwSetWindowTitle(title)
 
     
 def GetWindowSize():
-    width, height = _ctypes.c_int(), _ctypes.c_int()
-    
-    _glfwdll.glfwGetWindowSize(_ctypes.byref(width), _ctypes.byref(height))
+    _scratch_int_a.value = _scratch_int_b.value = 0
+    _glfwGetWindowSize(_scratch_int_a_ref, _scratch_int_b_ref)
     
-    return width.value, height.value
+    return _unpack_int2(_scratch_ints)
     
     
 def SetWindowSize(width, height):
@@ -597,26 +974,14 @@ def SetWindowSize(width, height):
     if width < 0 or height < 0:
         raise ValueError("width and height must be non-negative")
         
-    _glfwdll.glfwSetWindowSize(int(width), int(height))
+    _glfwSetWindowSize(int(width), int(height))
     
     
 def SetWindowPos(x, y):
     if not _is_real(x) or not _is_real(y):
         raise ValueError("x and y must be numbers")
     
-    _glfwdll.glfwSetWindowPos(int(x), int(y))
-    
-    
-def IconifyWindow():
-    _glfwdll.glfwIconifyWindow()
-
-    
-def RestoreWindow():
-    _glfwdll.glfwRestoreWindow()
-
-    
-def SwapBuffers():
-    _glfwdll.glfwSwapBuffers()
+    _glfwSetWindowPos(int(x), int(y))
     
     
 def SwapInterval(interval):
@@ -626,311 +991,310 @@ def SwapInterval(interval):
     if interval < 0:
         raise ValueError("interval must be non-negative")
         
-    _glfwdll.glfwSwapInterval(interval)
+    _glfwSwapInterval(interval)
     
     
 def GetWindowParam(param):
-    if not _is_int(param):
-        raise TypeError("param must be a integer")
-    
-    if not param in (
-        OPENED, ACTIVE, ICONIFIED, ACCELERATED, RED_BITS, GREEN_BITS, BLUE_BITS,
-        ALPHA_BITS, DEPTH_BITS, STENCIL_BITS, REFRESH_RATE, ACCUM_RED_BITS, ACCUM_GREEN_BITS, ACCUM_BLUE_BITS, ACCUM_ALPHA_BITS,
-        AUX_BUFFERS, STEREO, WINDOW_NO_RESIZE, FSAA_SAMPLES,
-        OPENGL_VERSION_MAJOR, OPENGL_VERSION_MINOR, OPENGL_FORWARD_COMPAT, OPENGL_DEBUG_CONTEXT, OPENGL_PROFILE
-    ):
-        raise ValueError("invalid requested parameter")
+    # members of WindowParam are valid by definition, only check other values
+    if __debug__ and type(param) is not WindowParam:
+        if not _is_int(param):
+            raise TypeError("param must be a integer")
+        
+        if not param in _VALID_WINDOW_PARAMS:
+            raise ValueError("invalid requested parameter")
     
-    return _glfwdll.glfwGetWindowParam(param)
+    return _glfwGetWindowParam(param)
 
 
-def SetWindowSizeCallback(func):
-    if func is None:
-        callback = None
-    else:
-        if not _is_callable_nargs(func, 2):
-            raise TypeError("incompatible callback (a callable taking two arguments is required)")
-            
-        callback = SetWindowSizeCallback._callbacktype(func)
+def jit_callback(signature):
+    """Returns a decorator compiling a callback to machine code with numba.cfunc.
+    
+    GLFW calls the compiled callback directly, without entering the Python
+    interpreter. numba is only imported when this is called.
+    """
     
-    # we must keep a reference
-    SetWindowSizeCallback._callback = callback
-    _glfwdll.glfwSetWindowSizeCallback(_ctypes.cast(callback, _ctypes.c_void_p))
+    import numba
     
+    return numba.cfunc(signature)
 
-def SetWindowCloseCallback(func):
-    if func is None:
-        callback = None
-    else:
-        if not _is_callable_nargs(func, 0):
-            raise TypeError("incompatible callback (a callable taking no arguments is required)")
-            
-        callback = SetWindowCloseCallback._callbacktype(lambda: bool(func()))
-        
-    SetWindowCloseCallback._callback = callback
-    _glfwdll.glfwSetWindowCloseCallback(_ctypes.cast(callback, _ctypes.c_void_p))
 
+# The callback setters all work the same, they only differ in the callback type,
+# the number of arguments of the callback and how the arguments and result are
+# converted between C and Python. So they're made from a single template.
 
-def SetWindowRefreshCallback(func):
-    if func is None:
-        callback = None
-    else:
-        if not _is_callable_nargs(func, 0):
-            raise TypeError("incompatible callback (a callable taking no arguments is required)")
+_NARGS_DESCRIPTIONS = ("no arguments", "one argument", "two arguments")
+
+
+def _make_callback_setter(name, callbacktype, nargs, adapt=None):
+    """Returns a callback setter installing callbacks through _glfw + name.
+    
+    Python callbacks must take nargs arguments, adapt (if given) wraps them in a
+    function converting the C arguments and result. Compiled callbacks (see
+    jit_callback) are installed as is.
+    """
+    
+    def setter(func):
+        if func is None:
+            # a NULL function pointer unsets the callback
+            callback = setter._nullcallback
+        elif _is_native_callback(func):
+            callback = _native_callback(callbacktype, func)
+        else:
+            if not _is_callable_nargs(func, nargs):
+                raise TypeError("incompatible callback (a callable taking %s is required)" % _NARGS_DESCRIPTIONS[nargs])
+            
+            callback = callbacktype(func if adapt is None else adapt(func))
         
-        callback = SetWindowRefreshCallback._callbacktype(func)
+        # we must keep a reference
+        setter._callback = callback
         
-    SetWindowRefreshCallback._callback = callback
-    _glfwdll.glfwSetWindowRefreshCallback(_ctypes.cast(callback, _ctypes.c_void_p))
+        # looked up on every call, the library is loaded lazily
+        globals()["_glfw" + name](callback)
     
-        
-def GetVideoModes():
-    video_modes = (vidmode._struct * GetVideoModes.MAX_MODES)()
-    num_modes = _glfwdll.glfwGetVideoModes(video_modes, GetVideoModes.MAX_MODES)
+    setter.__name__ = setter.__qualname__ = name
+    setter._callbacktype = callbacktype
+    setter._nullcallback = callbacktype()
+    setter._callback = None
     
-    result = []
-    for i in range(num_modes):
-        video_mode = video_modes[i]
-        result.append(vidmode(video_mode.Width, video_mode.Height, video_mode.RedBits, video_mode.GreenBits, video_mode.BlueBits))
+    return setter
+
+
+def _adapt_close_callback(func):
+    """Wraps a window close callback, GLFW wants an int back."""
     
-    return result
+    return lambda: bool(func())
 
-# this should be sufficient, but we put it in a function attribute so one can change it if nessecary
-GetVideoModes.MAX_MODES = 128
+
+def _adapt_key_callback(func):
+    """Wraps a key callback, latin-1 keys are passed as one-character strings."""
     
+    def key_callback(key, action):
+        func(_CHR256[key] if 0 <= key < 256 else key, action)
     
-def GetDesktopMode():
-    video_mode = vidmode._struct()
+    return key_callback
+
+
+def _adapt_char_callback(func):
+    """Wraps a char callback, characters are always passed as one-character strings."""
     
-    _glfwdll.glfwGetDesktopMode(_ctypes.byref(video_mode))
+    def char_callback(char, action):
+        func(_CHR256[char] if char < 256 else chr(char), action)
     
-    return vidmode(video_mode.Width, video_mode.Height, video_mode.RedBits, video_mode.GreenBits, video_mode.BlueBits)
+    return char_callback
 
 
-def PollEvents():
-    _glfwdll.glfwPollEvents()
+SetWindowSizeCallback = _make_callback_setter("SetWindowSizeCallback", _GLFWwindowsizefun, 2)
+SetWindowCloseCallback = _make_callback_setter("SetWindowCloseCallback", _GLFWwindowclosefun, 0, _adapt_close_callback)
+SetWindowRefreshCallback = _make_callback_setter("SetWindowRefreshCallback", _GLFWwindowrefreshfun, 0)
     
+        
+def GetVideoModes():
+    max_modes = GetVideoModes.MAX_MODES
+    
+    # the buffer is reused between calls, unless MAX_MODES has been changed
+    video_modes = GetVideoModes._buffer
+    if video_modes is None or len(video_modes) != max_modes:
+        video_modes = GetVideoModes._buffer = (vidmode._struct * max_modes)()
     
-def WaitEvents():
-    _glfwdll.glfwWaitEvents()
+    num_modes = _glfwGetVideoModes(video_modes, max_modes)
+    
+    return [vidmode(mode.Width, mode.Height, mode.RedBits, mode.GreenBits, mode.BlueBits)
+            for mode in video_modes[:num_modes]]
 
+# this should be sufficient, but we put it in a function attribute so one can change it if nessecary
+GetVideoModes.MAX_MODES = 128
+GetVideoModes._buffer = None
     
+    
+def GetDesktopMode():
+    # GLFW doesn't write the mode when it isn't initialized
+    _ctypes.memset(_scratch_vidmode_ref, 0, _ctypes.sizeof(_scratch_vidmode))
+    _glfwGetDesktopMode(_scratch_vidmode_ref)
+    
+    return vidmode(_scratch_vidmode.Width, _scratch_vidmode.Height, _scratch_vidmode.RedBits, _scratch_vidmode.GreenBits, _scratch_vidmode.BlueBits)
+
+
 def GetKey(key):
-    try:
-        # passed a string?
-        key = ord(key.encode("latin-1").upper())
-    except:
-        # must be an integer, no?
-        if not key in GetKey._legal_keycodes:
+    if isinstance(key, str):
+        try:
+            key = _KEY_FROM_STR[key]
+        except KeyError:
+            raise ValueError("key must be one of the keycodes or a one-character latin-1 string") from None
+    
+    # must be an integer, no? (GLFW ignores invalid keycodes, so -O skips this)
+    elif __debug__:
+        if not _is_int(key) or not 0 <= key < len(GetKey._legal_keymask) or not GetKey._legal_keymask[key]:
             raise ValueError("key must be one of the keycodes or a one-character latin-1 string")
     
-    return _glfwdll.glfwGetKey(key)
+    return _glfwGetKey(key)
+    
+def _make_legal_keymask():
+    """Returns a bytes object, indexed by keycode, which is 1 for the keycodes GetKey accepts."""
     
-# too tedious to repeat here, use locals()
-GetKey._legal_keycodes = set([code for var, code in list(globals().items()) if var.startswith("KEY_")])
-GetKey._legal_keycodes.remove(KEY_UNKNOWN)
-GetKey._legal_keycodes.remove(KEY_SPECIAL)
-try:
-	del var, code
-except NameError: # not in all versions these "leak"
-	pass
+    # too tedious to repeat here, use the Key enum - which also keeps KEY_REPEAT,
+    # an Enable token, from sneaking in like it did when this scanned for KEY_ names
+    legal_keycodes = set(Key) - {KEY_UNKNOWN, KEY_SPECIAL}
     
+    # a byte lookup is cheaper than hashing into a set
+    return bytes([code in legal_keycodes for code in range(max(legal_keycodes) + 1)])
+
+GetKey._legal_keymask = _make_legal_keymask()
+del _make_legal_keymask
+
+
 def GetMouseButton(button):
-    if not _is_int(button):
-        raise TypeError("button must be a integer")
-        
-    if not button in (MOUSE_BUTTON_1, MOUSE_BUTTON_2, MOUSE_BUTTON_3, MOUSE_BUTTON_4,
-                      MOUSE_BUTTON_5, MOUSE_BUTTON_6, MOUSE_BUTTON_7, MOUSE_BUTTON_8):
-        raise ValueError("button must be one of the button codes")
+    if __debug__ and type(button) is not MouseButton:
+        if not _is_int(button):
+            raise TypeError("button must be a integer")
+            
+        if not button in (MOUSE_BUTTON_1, MOUSE_BUTTON_2, MOUSE_BUTTON_3, MOUSE_BUTTON_4,
+                          MOUSE_BUTTON_5, MOUSE_BUTTON_6, MOUSE_BUTTON_7, MOUSE_BUTTON_8):
+            raise ValueError("button must be one of the button codes")
     
-    return _glfwdll.glfwGetMouseButton(button)
+    return _glfwGetMouseButton(button)
 
     
 def GetMousePos():
-    x, y = _ctypes.c_int(), _ctypes.c_int()
+    _scratch_int_a.value = _scratch_int_b.value = 0
+    _glfwGetMousePos(_scratch_int_a_ref, _scratch_int_b_ref)
     
-    _glfwdll.glfwGetMousePos(_ctypes.byref(x), _ctypes.byref(y))
-    
-    return x.value, y.value
+    return _unpack_int2(_scratch_ints)
 
     
 def SetMousePos(x, y):
-    if not _is_real(x) or not _is_real(y):
-        raise TypeError("x and y should be numbers")
+    if __debug__:
+        if not _is_real(x) or not _is_real(y):
+            raise TypeError("x and y should be numbers")
     
-    _glfwdll.glfwSetMousePos(int(x), int(y))
-    
-
-def GetMouseWheel():
-    return _glfwdll.glfwGetMouseWheel()
+    _glfwSetMousePos(int(x), int(y))
     
 
 def SetMouseWheel(pos):
     if not _is_int(pos):
         raise TypeError("pos should be an integer")
     
-    _glfwdll.glfwSetMouseWheel(pos)
+    _glfwSetMouseWheel(pos)
     
 
-def SetKeyCallback(func):
-    if func is None:
-        callback = None
-    else:
-        if not _is_callable_nargs(func, 2):
-            raise TypeError("incompatible callback (a callable taking two arguments is required)")
-        
-        callback = SetKeyCallback._callbacktype(lambda key, action: func(chr(key) if key < 256 else key, action))
-        
-    SetKeyCallback._callback = callback
-    _glfwdll.glfwSetKeyCallback(_ctypes.cast(callback, _ctypes.c_void_p))
-    
-    
-def SetCharCallback(func):
-    if func is None:
-        callback = None
-    else:
-        if not _is_callable_nargs(func, 2):
-            raise TypeError("incompatible callback (a callable taking two arguments is required)")
-        
-        callback = SetCharCallback._callbacktype(lambda char, action: func(chr(char), action))
-        
-    SetCharCallback._callback = callback
-    _glfwdll.glfwSetCharCallback(_ctypes.cast(callback, _ctypes.c_void_p))
-    
-    
-def SetMouseButtonCallback(func):
-    if func is None:
-        callback = None
-    else:
-        if not _is_callable_nargs(func, 2):
-            raise TypeError("incompatible callback (a callable taking two arguments is required)")
-        
-        callback = SetMouseButtonCallback._callbacktype(func)
-        
-    SetMouseButtonCallback._callback = callback
-    _glfwdll.glfwSetMouseButtonCallback(_ctypes.cast(callback, _ctypes.c_void_p))
-    
-    
-def SetMousePosCallback(func):
-    if func is None:
-        callback = None
-    else:
-        if not _is_callable_nargs(func, 2):
-            raise TypeError("incompatible callback (a callable taking two arguments is required)")
-        
-        callback = SetMousePosCallback._callbacktype(func)
-        
-    SetMousePosCallback._callback = callback
-    _glfwdll.glfwSetMousePosCallback(_ctypes.cast(callback, _ctypes.c_void_p))
-    
-    
-def SetMouseWheelCallback(func):
-    if func is None:
-        callback = None
-    else:
-        if not _is_callable_nargs(func, 1):
-            raise TypeError("incompatible callback (a callable taking one arguments is required)")
-        
-        callback = SetMouseWheelCallback._callbacktype(func)
-        
-    SetMouseWheelCallback._callback = callback
-    _glfwdll.glfwSetMouseWheelCallback(_ctypes.cast(callback, _ctypes.c_void_p))
+SetKeyCallback = _make_callback_setter("SetKeyCallback", _GLFWkeyfun, 2, _adapt_key_callback)
+SetCharCallback = _make_callback_setter("SetCharCallback", _GLFWcharfun, 2, _adapt_char_callback)
+SetMouseButtonCallback = _make_callback_setter("SetMouseButtonCallback", _GLFWmousebuttonfun, 2)
+SetMousePosCallback = _make_callback_setter("SetMousePosCallback", _GLFWmouseposfun, 2)
+SetMouseWheelCallback = _make_callback_setter("SetMouseWheelCallback", _GLFWmousewheelfun, 1)
     
 
 def ExtensionSupported(extension):
-    return _glfwdll.glfwExtensionSupported(extension.encode("latin-1")) == GL_TRUE
+    # GLFW also closes the window by itself (e.g. from PollEvents or
+    # SwapBuffers), so the cache is only trusted while a window is open
+    if not _glfwGetWindowParam(OPENED):
+        ExtensionSupported._cache.clear()
+        return False
+    try:
+        return ExtensionSupported._cache[extension]
+    except KeyError:
+        # already encoded names are passed through as is
+        supported = bool(_glfwExtensionSupported(extension if isinstance(extension, bytes) else _encode_latin1(extension)))
+        ExtensionSupported._cache[extension] = supported
+        
+        return supported
+
+# the supported extensions can't change as long as the OpenGL context lives, so
+# they're cached until the window is opened/closed (by us or by GLFW) or GLFW is
+# terminated
+ExtensionSupported._cache = {}
 
 
 def GetProcAddress(procname):
-    return _glfwdll.glfwGetProcAddress(procname.encode("latin-1"))
+    return _glfwGetProcAddress(procname if isinstance(procname, bytes) else _encode_latin1(procname))
 
 
 def GetGLVersion():
-    major, minor, rev = _ctypes.c_int(), _ctypes.c_int(), _ctypes.c_int()
+    _scratch_int_a.value = _scratch_int_b.value = _scratch_int_c.value = 0
+    _glfwGetGLVersion(_scratch_int_a_ref, _scratch_int_b_ref, _scratch_int_c_ref)
     
-    _glfwdll.glfwGetGLVersion(_ctypes.byref(major), _ctypes.byref(minor), _ctypes.byref(rev))
-    
-    return (major.value, minor.value, rev.value)   
+    return _unpack_int3(_scratch_ints)
 
 
 def GetJoystickParam(joy, param):
-    if not _is_int(joy) or not _is_int(param):
-        raise TypeError("joy and param must be integers")
+    if __debug__:
+        if not _is_int(joy) or not _is_int(param):
+            raise TypeError("joy and param must be integers")
+        
+        if not param in _VALID_JOYSTICK_PARAMS:
+            raise ValueError("param must be one of glfw.PRESENT, glfw.AXES or glfw.BUTTONS")
     
-    # the last time I checked the JOYSTICK_n were simply from 0 to 15 inclusive
-    if not joy in set(range(16)):
+    # the JOYSTICK_n are simply 0 to JOYSTICK_LAST inclusive - GLFW indexes its
+    # joystick array with joy unchecked, so this must stay even under -O
+    if not 0 <= joy <= JOYSTICK_LAST:
         raise ValueError("joy must be one of the glfw.JOYSTICK_n constants")
     
-    if not param in (PRESENT, AXES, BUTTONS):
-        raise ValueError("param must be one of glfw.PRESENT, glfw.AXES or glfw.BUTTONS")
-    
-    return _glfwdll.glfwGetJoystickParam(joy, param)
+    return _glfwGetJoystickParam(joy, param)
     
 
 def GetJoystickPos(joy):
-    if not _is_int(joy):
-        raise TypeError("joy must an integer")
+    if __debug__:
+        if not _is_int(joy):
+            raise TypeError("joy must an integer")
     
-    if not joy in set(range(16)):
+    if not 0 <= joy <= JOYSTICK_LAST:
         raise ValueError("joy must be one of the glfw.JOYSTICK_n constants")
     
-    max_axes = _glfwdll.glfwGetJoystickParam(joy, AXES)
-    pos = (_ctypes.c_float * max_axes)()
-    num_axes = _glfwdll.glfwGetJoystickPos(joy, pos, max_axes)
+    max_axes = _glfwGetJoystickParam(joy, AXES)
     
-    return [pos[i] for i in range(num_axes)]
+    # GLFW writes straight into the memory of the returned array
+    pos = _array("f", [0.0]) * max_axes
+    num_axes = _glfwGetJoystickPos(joy, (_ctypes.c_float * max_axes).from_buffer(pos), max_axes)
+    del pos[num_axes:]
+    
+    return pos
 
 
 def GetJoystickButtons(joy):
-    if not _is_int(joy):
-        raise TypeError("joy must an integer")
+    if __debug__:
+        if not _is_int(joy):
+            raise TypeError("joy must an integer")
     
-    if not joy in set(range(16)):
+    if not 0 <= joy <= JOYSTICK_LAST:
         raise ValueError("joy must be one of the glfw.JOYSTICK_n constants")
     
-    max_buttons = _glfwdll.glfwGetJoystickParam(joy, BUTTONS)
-    buttons = (_ctypes.c_ubyte * max_buttons)()
-    num_buttons = _glfwdll.glfwGetJoystickButtons(joy, buttons, max_buttons)
+    max_buttons = _glfwGetJoystickParam(joy, BUTTONS)
+    
+    buttons = _array("B", [0]) * max_buttons
+    num_buttons = _glfwGetJoystickButtons(joy, (_ctypes.c_ubyte * max_buttons).from_buffer(buttons), max_buttons)
+    del buttons[num_buttons:]
     
-    return [buttons[i] for i in range(num_buttons)]
+    return buttons
     
 
 def Enable(token):
     if not _is_int(token):
         raise TypeError("token must be an integer")
     
-    if not token in (MOUSE_CURSOR, STICKY_KEYS, STICKY_MOUSE_BUTTONS, SYSTEM_KEYS, KEY_REPEAT, AUTO_POLL_EVENTS):
+    if not token in _VALID_ENABLE_TOKENS:
         raise ValueError("token must be a valid feature code")
     
-    _glfwdll.glfwEnable(token)
+    _glfwEnable(token)
 
     
 def Disable(token):
     if not _is_int(token):
         raise TypeError("token must be an integer")
     
-    if not token in (MOUSE_CURSOR, STICKY_KEYS, STICKY_MOUSE_BUTTONS, SYSTEM_KEYS, KEY_REPEAT, AUTO_POLL_EVENTS):
+    if not token in _VALID_ENABLE_TOKENS:
         raise ValueError("token must be a valid feature code")
     
-    _glfwdll.glfwDisable(token)
+    _glfwDisable(token)
     
     
-#####################
-# function typedefs #
-#####################
-
-SetWindowSizeCallback._callbacktype = func_typedef(None, _ctypes.c_int, _ctypes.c_int)
-SetWindowCloseCallback._callbacktype = func_typedef(_ctypes.c_int)
-SetWindowRefreshCallback._callbacktype = func_typedef(None)
-SetKeyCallback._callbacktype = func_typedef(None, _ctypes.c_int, _ctypes.c_int)
-SetCharCallback._callbacktype = func_typedef(None, _ctypes.c_int, _ctypes.c_int)
-SetMouseButtonCallback._callbacktype = func_typedef(None, _ctypes.c_int, _ctypes.c_int)
-SetMousePosCallback._callbacktype = func_typedef(None, _ctypes.c_int, _ctypes.c_int)
-SetMouseWheelCallback._callbacktype = func_typedef(None, _ctypes.c_int)
-
 # delete no longer needed helper functions
-del func_def
 del func_typedef
 
-# load submodules
-import glfw.ext
\ No newline at end of file
+# submodules are only imported on first access (PEP 562), most programs never
+# touch glfw.ext
+def __getattr__(name):
+    if name == "ext":
+        import glfw.ext
+        
+        return glfw.ext
+    
+    raise AttributeError("module 'glfw' has no attribute %s" % repr(name))
\ No newline at end of file
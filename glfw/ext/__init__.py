@@ -32,7 +32,11 @@ if os.name == "nt":
     
     
     def set_icons(icons):
-        """Sets the window icons."""
+        """Sets the window icons.
+        
+        icons is a list of (data, width, height) tuples, with data being the
+        RGBA pixels as bytes (or a latin-1 string) - the best fitting size is
+        used for each icon."""
         
         _win32.set_icons(icons)
         
@@ -49,7 +53,11 @@ else:
     
     
     def set_icons(icons):
-        """Sets the window icons."""
+        """Sets the window icons.
+        
+        icons is a list of (data, width, height) tuples, with data being the
+        RGBA pixels as bytes (or a latin-1 string) - the best fitting size is
+        used for each icon."""
         
         pass
         
@@ -86,16 +94,20 @@ class OpenGLWrapper(object):
         self.funcprototype = _functype(restype, *argtypes)
         self.glfunc = None
     
-    def __call__(self, *args, **kwargs):
-        if self.glfunc is None:
+    def __call__(self, *args):
+        # GL functions get called a lot, so look the attribute up only once
+        glfunc = self.glfunc
+        
+        if glfunc is None:
             proc_addr = _glfw.GetProcAddress(self.funcname)
             
             if proc_addr is None:
-                raise RuntimeError("Couldn't load OpenGL function " + self.funcname)
+                raise RuntimeError("Couldn't load OpenGL function %s" % self.funcname)
             
-            self.glfunc = self.funcprototype(proc_addr)
+            glfunc = self.glfunc = self.funcprototype(proc_addr)
         
-        return self.glfunc(*args, **kwargs)
+        # foreign functions take no keyword arguments, so none are forwarded
+        return glfunc(*args)
     
     def __repr__(self):
         return "glfw.ext.OpenGLWrapper(%s, %s, %s)" % (repr(self.funcname), repr(self.restype), repr(self.argtypes))
\ No newline at end of file
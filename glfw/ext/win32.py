@@ -78,6 +78,38 @@ kernel32.GetCurrentProcessId.argtypes = []
 user32.GetSystemMetrics.restype = c_int
 user32.GetSystemMetrics.argtypes = [c_int]
 
+user32.GetClassNameA.restype = c_int
+user32.GetClassNameA.argtypes = [HWND, LPSTR, c_int]
+
+user32.EnumWindows.restype = BOOL
+user32.EnumWindows.argtypes = [WNDENUMPROC, LPARAM]
+
+# without restype/argtypes ctypes truncates handles to a C int on 64-bit Windows
+user32.GetDC.restype = HDC
+user32.GetDC.argtypes = [HWND]
+
+user32.ReleaseDC.restype = c_int
+user32.ReleaseDC.argtypes = [HWND, HDC]
+
+gdi32.CreateDIBSection.restype = HBITMAP
+gdi32.CreateDIBSection.argtypes = [HDC, c_void_p, UINT, POINTER(c_void_p), HANDLE, DWORD]
+
+gdi32.CreateBitmap.restype = HBITMAP
+gdi32.CreateBitmap.argtypes = [c_int, c_int, UINT, UINT, c_void_p]
+
+gdi32.DeleteObject.restype = BOOL
+gdi32.DeleteObject.argtypes = [HGDIOBJ]
+
+# SetClassLongW can't hold a handle on 64-bit Windows, 32-bit Windows only
+# exports SetClassLongW (SetClassLongPtrW is a macro for it there)
+try:
+    SetClassLongPtrW = user32.SetClassLongPtrW
+except AttributeError:
+    SetClassLongPtrW = user32.SetClassLongW
+
+SetClassLongPtrW.restype = LPARAM
+SetClassLongPtrW.argtypes = [HWND, c_int, LPARAM]
+
 
 class CIEXYZ(Structure):
     _fields_ = [
@@ -133,6 +165,10 @@ class ICONINFO(Structure):
         ("hbmColor", HANDLE)
     ]
 
+
+user32.CreateIconIndirect.restype = HICON
+user32.CreateIconIndirect.argtypes = [POINTER(ICONINFO)]
+
     
 def get_hwnd():
     current_process = kernel32.GetCurrentProcessId()
@@ -147,7 +183,7 @@ def get_hwnd():
         classname = create_string_buffer(8)
         user32.GetClassNameA(hwnd, classname, len(classname))
         
-        if classname.value != "GLFW27":
+        if classname.value != b"GLFW27":
             return True
             
         callback.result = hwnd
@@ -166,14 +202,17 @@ def set_icons(images):
     def get_icon(image):
         image_data, image_width, image_height = image
         
+        # strings are taken as latin-1, so each character is one byte
+        if isinstance(image_data, str):
+            image_data = image_data.encode("latin-1")
+        
         if len(image_data) != image_width * image_height * 4:
             raise RuntimeError("image data size is incorrect")
             
         # convert RGBA to BGRA
-        new_image_data = []
-        for i in range(0, len(image_data), 4):
-            new_image_data.append(image_data[i+2] + image_data[i+1] + image_data[i] + image_data[i+3])
-        image_data = "".join(new_image_data)
+        image_data = bytearray(image_data)
+        image_data[0::4], image_data[2::4] = image_data[2::4], image_data[0::4]
+        image_data = bytes(image_data)
 
         header = BITMAPV5HEADER()
         header.bV5Size = sizeof(header)
@@ -230,7 +269,7 @@ def set_icons(images):
     
     hwnd = get_hwnd()
     image = best_image(user32.GetSystemMetrics(SM_CXICON), user32.GetSystemMetrics(SM_CYICON))
-    user32.SetClassLongW(hwnd, GCL_HICON, get_icon(image))
+    SetClassLongPtrW(hwnd, GCL_HICON, get_icon(image))
     
     image = best_image(user32.GetSystemMetrics(SM_CXSMICON), user32.GetSystemMetrics(SM_CYSMICON))
-    user32.SetClassLongW(hwnd, GCL_HICONSM, get_icon(image))
\ No newline at end of file
+    SetClassLongPtrW(hwnd, GCL_HICONSM, get_icon(image))
\ No newline at end of file
@@ -62,6 +62,7 @@ setup_info = {
         "Operating System :: POSIX :: Linux",
         "Intended Audience :: Developers",
         "Programming Language :: Python",
+        "Programming Language :: Python :: 3",
         "Topic :: Games/Entertainment",
         "Topic :: Software Development :: Libraries :: Python Modules",
     ],